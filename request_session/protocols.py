@@ -1,6 +1,6 @@
 """Simple protocols to duck type dependency injections."""
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 
 class SentryClient(object):
@@ -151,7 +151,7 @@ class Statsd(object):
     namespace = None  # type: str
 
     def increment(self, metric, value=1, tags=None, sample_rate=1):
-        # type: (str, int, List[str], int) -> None
+        # type: (str, int, Optional[Sequence[str]], int) -> None
         """Increment a counter, optionally setting a value, tags and a sample rate.
 
         >>> statsd.increment('page.views')
@@ -1,15 +1,19 @@
 """Main RequestSession module."""
 
+import atexit
+import errno
+import random
 import re
 import time
-from collections import namedtuple
+import weakref
 from copy import deepcopy
 from typing import List  # pylint: disable=unused-import
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple, Union
 
 import requests
 import requests.adapters
 import simplejson as json
+from urllib3.exceptions import ProtocolError
 
 from ._compat import urljoin
 from .exceptions import InvalidUserAgentString, RequestSessionException
@@ -21,7 +25,93 @@ from .utils import (
     traced_sleep,
 )
 
-Timeout = namedtuple("Timeout", ["connection_timeout", "read_timeout"])
+
+class Timeout(NamedTuple):
+    """Connection and read timeout pair passed to requests.
+
+    Kept a real tuple subclass on purpose: requests only unpacks timeout
+    objects that pass its ``isinstance(timeout, tuple)`` check.
+    """
+
+    connection_timeout: float
+    read_timeout: float
+
+
+# lookup table for is_server_error: 4xx responses are client errors,
+# everything else counts as a server error
+_IS_SERVER_ERROR = bytes(0 if 400 <= code < 500 else 1 for code in range(600))
+
+# maps exception class to (error_type, metric tag); resolved through the MRO
+# of the raised exception so subclasses classify like their closest ancestor
+_ERROR_TYPE_MAP = {
+    requests.exceptions.Timeout: ("read_timeout", "error:timeout"),
+    # ConnectTimeout inherits ConnectionError before Timeout, keep it classified
+    # as a timeout like the original isinstance chain did
+    requests.exceptions.ConnectTimeout: ("read_timeout", "error:timeout"),
+    requests.exceptions.HTTPError: ("http_error", "error:http_error"),
+    requests.exceptions.ConnectionError: ("connection_error", "error:connection_error"),
+}  # type: Dict[type, Tuple[str, str]]
+
+
+# sessions with metric buffering enabled; flushed by a single process-wide
+# atexit hook so registration does not hold strong references to instances
+_metric_buffering_instances = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+def _flush_buffered_metrics():
+    # type: () -> None
+    """Flush pending metric buffers of all live sessions at interpreter exit."""
+    for instance in list(_metric_buffering_instances):
+        instance._flush_metrics()  # pylint: disable=protected-access
+
+
+atexit.register(_flush_buffered_metrics)
+
+
+def _make_verb(verb):
+    # type: (str) -> Callable
+    """Build a ``RequestSession`` method running ``verb`` against a service."""
+
+    def verb_method(self, path, **kwargs):
+        # type: (RequestSession, str, Any) -> Optional[requests.Response]
+        return self._process(verb, self._url(path), **kwargs)
+
+    verb_method.__name__ = verb
+    verb_method.__doc__ = rf"""{verb.capitalize()} request against a service.
+
+    :param str path: URL path, will be combined with ``self.host`` to build whole
+        request url.
+    :param \*\*kwargs: Optional arguments that request takes
+        - check request_session and requests packages documentation for further reference.
+
+    :return requests.Response: HTTP Response Object
+
+    :raises requests.RequestException: Server error on operation
+        (if raise_for_status is True).
+    :raises RequestSessionException: Client error on operation (if raise_for_status is True)
+    """
+    return verb_method
+
+
+def _is_econnreset(error):
+    # type: (requests.RequestException) -> bool
+    """Check whether the exception was caused by a connection reset by peer.
+
+    Inspects the exception chain for a ``urllib3.exceptions.ProtocolError``
+    wrapping an ``OSError`` with ``errno.ECONNRESET`` so the common case is
+    decided without stringifying the whole exception. Falls back to a
+    substring check on ``str(error)`` when the typed inspection misses.
+
+    :param requests.RequestException error: exception to inspect
+    :return bool: whether error is a connection reset
+    """
+    cause = error.__cause__ or error.__context__ or error
+    if isinstance(cause, ProtocolError) and cause.args:
+        inner = cause.args[1] if len(cause.args) > 1 else cause.args[0]
+        if isinstance(inner, OSError) and inner.errno == errno.ECONNRESET:
+            return True
+
+    return "ECONNRESET" in str(error) or "Connection reset by peer" in str(error)
 
 
 class RequestSession(object):
@@ -50,8 +140,9 @@ class RequestSession(object):
     :param bool raise_for_status: (optional) Raise an exception in case of an error.
         Defaults to ``False``.
     :param str user_agent: (optional) User-Agent to be set in headers.
-    :param list[requests.Session] session_instances: (optional) A list of
-        ``requests.Session`` to be used to make the HTTP requests.
+    :param weakref.WeakSet session_instances: (optional) A set of
+        ``requests.Session`` instances used to make the HTTP requests. Sessions
+        dropped by their owner are garbage collected from the set automatically.
     :param Ddtrace ddtrace: (optional) DataDog function to be used to trace, track and
         send metrics for individual HTTP requests.
     :param str ddtrace_service_name: (optional) Service name passed to DataDog DdTrace. Set to "booking_api_requests"
@@ -59,15 +150,82 @@ class RequestSession(object):
     :param Statsd statsd: (optional) Datadog module to log metrics.
     :param SentryClient sentry_client: (optional) Sentry module to log exceptions.
     :param Callable logger: (optional) Logger to be used when logging to `stdout`
-        and `stderr`. If none is set, `builtin_logger` is used. Defaults to ``None``.
+        and `stderr`. If none is set, logging is a no-op. Defaults to ``None``.
     :param str log_prefix: (optional) Prefix to be used when logging to `stdout`
         and `stderr`. Defaults to ``requestsession``.
     :param Tuple[str] allowed_log_levels: (optional) Log levels that are supported by
         the `logger` used. Defaults to
         ``("debug", "info", "warning", "error", "critical", "exception", "log")``.
+    :param int pool_connections: (optional) Number of urllib3 connection pools
+        to cache in the mounted ``HTTPAdapter``. Defaults to ``32``.
+    :param int pool_maxsize: (optional) Maximum number of connections to keep
+        in each pool. Defaults to ``64``.
+    :param bool pool_block: (optional) Whether to block when a pool has no free
+        connection instead of opening a new one, providing backpressure under
+        high concurrency. Defaults to ``True``.
+    :param float session_ttl: (optional) Maximum age of the underlying session
+        in seconds. Once exceeded, the session is lazily replaced before the
+        next request, so long-lived processes do not keep stale keep-alive
+        sockets around. Defaults to ``None`` (sessions never expire).
+    :param float backoff_base: (optional) Base in seconds for full-jitter
+        exponential backoff between retries. When set, it takes precedence over
+        the fixed ``sleep_before_repeat`` delay. Defaults to ``None``.
+    :param float max_backoff: (optional) Upper bound in seconds for the
+        exponential backoff delay. Defaults to ``15.0``.
+    :param int metric_flush_every: (optional) When set, metric increments are
+        aggregated in-process and flushed to statsd in batches once this many
+        increments are buffered (and at interpreter exit), instead of entering
+        the statsd client on every request. Defaults to ``None`` (increments
+        are sent immediately).
+    :param int max_response_log_bytes: (optional) Maximum number of body bytes
+        decoded into the ``response_text`` attached to log events. Keeps log
+        payloads bounded and avoids whole-body charset detection for large
+        responses. Defaults to ``2048``.
+
+    Call :meth:`close_all_sessions` on application shutdown to drain the
+    pooled sockets.
     """
 
-    session_instances = []  # type: List[requests.Session]
+    __slots__ = (
+        "host",
+        "auth",
+        "timeout",
+        "verify",
+        "max_retries",
+        "verbose_logging",
+        "request_param_logging_blacklist",
+        "headers",
+        "request_category",
+        "raise_for_status",
+        "user_agent",
+        "user_agent_components",
+        "ddtrace",
+        "ddtrace_service_name",
+        "statsd",
+        "sentry_client",
+        "logger",
+        "log_prefix",
+        "allowed_log_levels",
+        "retriable_client_errors",
+        "pool_connections",
+        "pool_maxsize",
+        "pool_block",
+        "session_ttl",
+        "backoff_base",
+        "max_backoff",
+        "metric_flush_every",
+        "max_response_log_bytes",
+        "session",
+        "_host_root",
+        "_session_created",
+        "_metric_buffer",
+        "_buffered_metric_count",
+        "_allowed_log_levels",
+        "_log_fns",
+        "__weakref__",
+    )
+
+    session_instances = weakref.WeakSet()  # type: weakref.WeakSet
 
     def __init__(
         self,
@@ -99,9 +257,18 @@ class RequestSession(object):
         ),  # type: Tuple
         ddtrace_service_name="booking_api_requests",  # type: str
         retriable_client_errors=None,  # type: Optional[List[int]]
+        pool_connections=32,  # type: int
+        pool_maxsize=64,  # type: int
+        pool_block=True,  # type: bool
+        session_ttl=None,  # type: Optional[float]
+        backoff_base=None,  # type: Optional[float]
+        max_backoff=15.0,  # type: float
+        metric_flush_every=None,  # type: Optional[int]
+        max_response_log_bytes=2048,  # type: int
     ):
         # type: (...) -> None
         self.host = host
+        self._host_root = urljoin(host, "/").rstrip("/") if host else None
         self.auth = auth
         self.timeout = timeout
         self.verify = verify
@@ -123,9 +290,23 @@ class RequestSession(object):
         self.logger = logger
         self.log_prefix = log_prefix
         self.allowed_log_levels = allowed_log_levels
+        self._allowed_log_levels = frozenset(allowed_log_levels)
+        self._log_fns = {}  # type: Dict[str, Callable]
         self.retriable_client_errors = (
             retriable_client_errors if retriable_client_errors else [408]
         )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.session_ttl = session_ttl
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.metric_flush_every = metric_flush_every
+        self.max_response_log_bytes = max_response_log_bytes
+        self._metric_buffer = {}  # type: Dict[Tuple[str, Tuple[str, ...]], int]
+        self._buffered_metric_count = 0
+        if metric_flush_every:
+            _metric_buffering_instances.add(self)
 
         self.prepare_new_session()
 
@@ -133,9 +314,15 @@ class RequestSession(object):
         # type: () -> None
         """Prepare new configured session."""
         self.session = requests.Session()
-        self.session_instances.append(self.session)
-
-        adapter = requests.adapters.HTTPAdapter(max_retries=1)
+        self._session_created = time.monotonic()
+        self.session_instances.add(self.session)
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=1,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -152,16 +339,15 @@ class RequestSession(object):
 
     def remove_session(self):
         # type: () -> None
-        """Close session and remove it from list of session instances."""
-        if self.session in self.session_instances:
-            del self.session_instances[self.session_instances.index(self.session)]
+        """Close session and remove it from the set of session instances."""
+        self.session_instances.discard(self.session)
         self.session.close()
 
     def set_user_agent(self):
         # type: () -> None
         """Set proper user-agent string to header according to RFC22."""
         pattern = r"^(?P<service_name>\S.+?)\/(?P<version>\S.+?) \((?P<organization>\S.+?) (?P<environment>\S.+?)\)(?: ?(?P<sys_info>.*))$"
-        string = f"{self.user_agent_components.service_name}/{self.user_agent_components.version} ({self.user_agent_components.organization} {self.user_agent_components.environment}) {self.user_agent_components.sys_info if self.user_agent_components.sys_info else ''}".strip()
+        string = self.user_agent_components.user_agent
         if not re.match(pattern, string):
             raise InvalidUserAgentString("Provided User-Agent string is not valid.")
         self.user_agent = string
@@ -171,99 +357,33 @@ class RequestSession(object):
     def close_all_sessions(cls):
         # type: () -> None
         """Close and remove all sessions in cls.session_instances."""
-        for session in cls.session_instances:
+        for session in list(cls.session_instances):
             session.close()
-        cls.session_instances = []
-
-    def delete(self, path, **kwargs):
-        # type: (str, Any) -> Optional[requests.Response]
-        r"""Delete request against a service.
-
-        :param str path: URL path, will be combined with ``self.host`` to build whole
-            request url.
-        :param \*\*kwargs: Optional arguments that request takes
-            - check request_session and requests packages documentation for further reference.
-
-        :return requests.Response: HTTP Response Object
-
-        :raises requests.RequestException: Server error on operation
-            (if raise_for_status is True).
-        :raises RequestSessionException: Client error on operation (if raise_for_status is True)
-        """
-        url = urljoin(self.host, path) if self.host else path
-        return self._process("delete", url, **kwargs)
-
-    def get(self, path, **kwargs):
-        # type: (str, Any) -> Optional[requests.Response]
-        r"""Get request against a service.
-
-        :param str path: URL path, will be combined with ``self.host`` to build whole
-            request URL.
-        :param \*\*kwargs: Optional arguments that request takes
-            - check request_session and requests packages documentation for further reference.
-
-        :return requests.Response: HTTP Response Object
-
-        :raises requests.RequestException: Server error on operation
-            (if raise_for_status is True).
-        :raises RequestSessionException: Client error on operation (if raise_for_status is True)
-        """
-        url = urljoin(self.host, path) if self.host else path
-        return self._process("get", url, **kwargs)
-
-    def post(self, path, **kwargs):
-        # type: (str, Any) -> Optional[requests.Response]
-        r"""Post request against a service.
-
-        :param str path: url path, will be combined with ``self.host`` to build whole
-            request url.
-        :param \*\*kwargs: Optional arguments that request takes
-            - check request_session and requests packages documentation for further reference.
-
-        :return requests.Response: HTTP Response Object
-
-        :raises requests.RequestException: Server error on operation
-            (if raise_for_status is True).
-        :raises RequestSessionException: Client error on operation (if raise_for_status is True).
-        """
-        url = urljoin(self.host, path) if self.host else path
-        return self._process("post", url, **kwargs)
-
-    def put(self, path, **kwargs):
-        # type: (str, Any) -> Optional[requests.Response]
-        r"""Put request against a service.
+        cls.session_instances.clear()
 
-        :param str path: URL path, will be combined with ``self.host`` to build whole
-            request url.
-        :param \*\*kwargs: Optional arguments that request takes
-            - check request_session and requests packages documentation for further reference.
+    def _url(self, path):
+        # type: (str) -> str
+        """Build the request URL, matching ``urljoin(self.host, path)``.
 
-        :return requests.Response: HTTP Response Object
+        The host's scheme-and-netloc root is parsed once at init, so the
+        common case of an absolute path is plain concatenation; anything
+        urljoin treats specially (absolute URLs, network-path references,
+        dot segments, relative paths) falls through to ``urljoin`` itself.
 
-        :raises requests.RequestException: Server error on operation
-            (if raise_for_status is True).
-        :raises RequestSessionException: Client error on operation (if raise_for_status is True)
+        :param str path: URL path or absolute URL.
+        :return str: URL the request will be made against.
         """
-        url = urljoin(self.host, path) if self.host else path
-        return self._process("put", url, **kwargs)
-
-    def patch(self, path, **kwargs):
-        # type: (str, Any) -> Optional[requests.Response]
-        r"""Patch request against a service.
-
-        :param str path: URL path, will be combined with ``self.host`` to build whole
-            request url.
-        :param \*\*kwargs: Optional arguments that request takes
-            - check request_session and requests packages documentation for further reference.
-
-        :return requests.Response: HTTP Response Object
-
-        :raises requests.RequestException: Server error on operation
-            (if raise_for_status is True).
-        :raises RequestSessionException: Client error on operation (if raise_for_status is True)
-        """
-        url = urljoin(self.host, path) if self.host else path
-        return self._process("patch", url, **kwargs)
+        if not self.host or path.startswith(("http://", "https://")):
+            return path
+        if path.startswith("/") and not path.startswith("//") and "/." not in path:
+            return self._host_root + path
+        return urljoin(self.host, path)
+
+    delete = _make_verb("delete")
+    get = _make_verb("get")
+    post = _make_verb("post")
+    put = _make_verb("put")
+    patch = _make_verb("patch")
 
     def _process(
         self,
@@ -288,6 +408,7 @@ class RequestSession(object):
             error.
         :param bool report: Report request exceptions to error_lib.swallow.
         :param float sleep_before_repeat: Seconds to sleep before another retry.
+            Ignored when ``backoff_base`` is configured on the session.
         :param list tags: tags for Datadog
         :param bool raise_for_status: Raise an exception in case of an error response.
         :param \*\*request_kwargs: Optional arguments that request takes:
@@ -305,8 +426,8 @@ class RequestSession(object):
             "timeout": self.timeout,
             "verify": self.verify,
             "params": None,
+            **request_kwargs,
         }  # type: Dict
-        request_params.update(request_kwargs)
 
         response = None
         request_category = self._get_request_category(request_category)
@@ -327,16 +448,18 @@ class RequestSession(object):
                 )
                 response.raise_for_status()
 
-                success_tags = list(tags) if tags else []
-                success_tags.append("status:success")
-
-                self.metric_increment(
-                    metric="request",
-                    request_category=request_category,
-                    tags=success_tags,
-                    attempt=run,
+                success_tags = (
+                    (*tags, "status:success") if tags else ("status:success",)
                 )
 
+                if self.statsd is not None:
+                    self.metric_increment(
+                        metric="request",
+                        request_category=request_category,
+                        tags=success_tags,
+                        attempt=run,
+                    )
+
                 self._log_with_params(
                     request_params,
                     response,
@@ -347,23 +470,18 @@ class RequestSession(object):
                 )
 
             except requests.RequestException as error:
-                error_tags = list(tags) if tags else []
-
                 status_code = None if response is None else response.status_code
 
                 is_econnreset_error = isinstance(
                     error, requests.exceptions.ConnectionError
-                ) and (
-                    "ECONNRESET" in str(error)
-                    or "Connection reset by peer" in str(error)
-                )
+                ) and _is_econnreset(error)
 
                 if not is_econnreset_error:
                     self._exception_log_and_metrics(
                         error=error,
                         request_category=request_category,
                         request_params=request_params,
-                        dd_tags=error_tags,
+                        dd_tags=tags,
                         status_code=status_code,
                         attempt=run,
                     )
@@ -391,7 +509,7 @@ class RequestSession(object):
                                 error=error,
                                 request_category=request_category,
                                 request_params=request_params,
-                                dd_tags=error_tags,
+                                dd_tags=tags,
                                 status_code=status_code,
                                 attempt=run,
                             )
@@ -405,7 +523,7 @@ class RequestSession(object):
                     # Client error, request is not valid and server rejected it with
                     # http 4xx, but not timeout, there is no point in retrying.
                     if report and self.sentry_client is not None:
-                        response_text = self.get_response_text(response)
+                        response_text = self._response_snippet(response)
                         extra_data = (
                             {"response_text": response_text}
                             if response_text != ""
@@ -426,17 +544,37 @@ class RequestSession(object):
                         )
                     return response
 
-                if sleep_before_repeat:
+                delay = self._get_retry_delay(run, sleep_before_repeat)
+                if delay:
                     if self.ddtrace is not None:
-                        self.sleep(sleep_before_repeat, request_category, tags)
+                        self.sleep(delay, request_category, tags)
                     else:
-                        time.sleep(sleep_before_repeat)
+                        time.sleep(delay)
 
             else:
                 return response
 
         return None
 
+    def _get_retry_delay(self, run, sleep_before_repeat):
+        # type: (int, Optional[float]) -> Optional[float]
+        """Compute how long to sleep before the next retry attempt.
+
+        With ``backoff_base`` configured, the delay is full-jitter exponential
+        backoff capped at ``max_backoff``, so concurrent clients spread their
+        retries instead of hammering the backend at a fixed offset. Otherwise
+        the fixed ``sleep_before_repeat`` delay is preserved.
+
+        :param int run: Attempt number.
+        :param float sleep_before_repeat: (optional) Fixed delay in seconds.
+        :return: Seconds to sleep, or ``None`` for no delay.
+        """
+        if self.backoff_base is not None:
+            return random.random() * min(
+                self.backoff_base * 2 ** (run - 1), self.max_backoff
+            )
+        return sleep_before_repeat
+
     def _send_request(self, request_type, request_params, tags, run, request_category):
         # type: (str, Dict[str, Any], List[str], int, str) -> requests.Response
         """Send the request and metrics.
@@ -448,6 +586,13 @@ class RequestSession(object):
         :param str request_category: Category for log and metric reporting.
         :return requests.Response: HTTP Response Object.
         """
+        if (
+            self.session_ttl
+            and time.monotonic() - self._session_created > self.session_ttl
+        ):
+            self.remove_session()
+            self.prepare_new_session()
+
         metric_name = f"{request_category}.response_time"
 
         if not self.statsd:
@@ -470,12 +615,12 @@ class RequestSession(object):
     def _log_with_params(
         self, request_params, response, tags, request_category, attempt, url
     ):
-        # type: (Dict, requests.Response, List[str], str, int, str) -> None
+        # type: (Dict, requests.Response, Sequence[str], str, int, str) -> None
         """Prepare parameters and log response.
 
         :param Dict request_params: Parameters used in the request.
         :param requests.Response response: HTTP Response.
-        :param List[str] tags: Tags denoting success of the request.
+        :param Sequence[str] tags: Tags denoting success of the request.
         :param str request_category: Category of the request.
         """
         extra_params = (
@@ -487,7 +632,7 @@ class RequestSession(object):
                         if k not in self.request_param_logging_blacklist
                     }
                 ),
-                "response_text": self.get_response_text(response),
+                "response_text": self._response_snippet(response),
             }
             if self.verbose_logging
             else {}
@@ -516,7 +661,7 @@ class RequestSession(object):
         traced_sleep(trace_name, seconds, self.ddtrace, default_tags)  # type: ignore
 
     def metric_increment(self, metric, request_category, tags, attempt=None):
-        # type: (str, str, list, Optional[int]) -> None
+        # type: (str, str, Optional[Sequence[str]], Optional[int]) -> None
         """Metric request increment.
 
         :param str metric: Name of the metric to be incremented.
@@ -524,13 +669,29 @@ class RequestSession(object):
         :param List[str] tags: Tags to increment metric with.
         :param int attempt: Number of attempt of the request.
         """
-        new_tags = list(tags) if tags else []
+        if self.statsd is None:
+            return
+        new_tags = tuple(tags) if tags else ()
         if attempt:
-            new_tags.append(f"attempt:{attempt}")
+            new_tags += (f"attempt:{attempt}",)
+        metric_name = f"{request_category}.{metric}"
+        if self.metric_flush_every:
+            key = (metric_name, new_tags)
+            self._metric_buffer[key] = self._metric_buffer.get(key, 0) + 1
+            self._buffered_metric_count += 1
+            if self._buffered_metric_count >= self.metric_flush_every:
+                self._flush_metrics()
+        else:
+            self.statsd.increment(metric_name, tags=new_tags)
 
+    def _flush_metrics(self):
+        # type: () -> None
+        """Send buffered metric increments to statsd and clear the buffer."""
         if self.statsd is not None:
-            metric_name = f"{request_category}.{metric}"
-            self.statsd.increment(metric_name, tags=new_tags)
+            for (metric_name, tags), count in self._metric_buffer.items():
+                self.statsd.increment(metric_name, value=count, tags=tags)
+        self._metric_buffer.clear()
+        self._buffered_metric_count = 0
 
     def log(self, level, event, **kwargs):
         # type: (str, str, **Any) -> None
@@ -541,18 +702,21 @@ class RequestSession(object):
         :param event: event (<request_category> or <request_category>.<action>)
         :param \*\*kwargs: kw arguments to be logged
         """
-        if not level in self.allowed_log_levels:
+        if level not in self._allowed_log_levels:
             raise AttributeError("Provided log level is not allowed.")
-        event_name = f"{self.log_prefix}.{event}"
         if self.logger is not None:
-            getattr(self.logger, level)(event_name, **kwargs)
+            log_fn = self._log_fns.get(level)
+            if log_fn is None:
+                log_fn = getattr(self.logger, level)
+                self._log_fns[level] = log_fn
+            log_fn(f"{self.log_prefix}.{event}", **kwargs)
 
     def _exception_log_and_metrics(
         self,
         error,  # type: requests.RequestException
         request_category,  # type: str
         request_params,  # type: Dict
-        dd_tags,  # type: List[str]
+        dd_tags,  # type: Sequence[str]
         status_code,  # type: Union[int, None]
         attempt,  # type: int
     ):
@@ -562,30 +726,23 @@ class RequestSession(object):
         :param requests.RequestException error: exception that occurred
         :param str request_category: String describing request category.
         :param Dict request_params: Parameters used to make the HTTP call.
-        :param List[str] dd_tags: Tags to increment metric with.
+        :param Sequence[str] dd_tags: Tags to increment metric with.
         :param Union[int, None] status_code: HTTP status code of the response.
         """
-        tags = ["status:error"]
+        tags = ("status:error", *dd_tags) if dd_tags else ("status:error",)
 
-        tags.extend(dd_tags)
-        response_text = self.get_response_text(error.response)
+        response_text = self._response_snippet(error.response)
         extra_params = {"description": str(error), "response_text": response_text}
         split_tags_and_update(extra_params, tags)
 
-        if isinstance(error, requests.exceptions.Timeout):
-            error_type = "read_timeout"
-            tags.append("error:timeout")
-
-        elif isinstance(error, requests.exceptions.HTTPError):
-            error_type = "http_error"
-            tags.append("error:http_error")
-
-        elif isinstance(error, requests.exceptions.ConnectionError):
-            error_type = "connection_error"
-            tags.append("error:connection_error")
+        for klass in type(error).__mro__:
+            hit = _ERROR_TYPE_MAP.get(klass)
+            if hit:
+                error_type, error_tag = hit
+                break
         else:
-            error_type = "request_exception"
-            tags.append("error:request_exception")
+            error_type, error_tag = "request_exception", "error:request_exception"
+        tags += (error_tag,)
 
         if self.verbose_logging is True:
             extra_params["request_params"] = json.dumps(
@@ -605,11 +762,12 @@ class RequestSession(object):
             **extra_params,
         )
 
-        self.metric_increment(
-            metric="request",
-            request_category=request_category,
-            tags=tags + [f"attempt:{attempt}"],
-        )
+        if self.statsd is not None:
+            self.metric_increment(
+                metric="request",
+                request_category=request_category,
+                tags=tags + (f"attempt:{attempt}",),
+            )
 
     @staticmethod
     def is_server_error(error, http_code):
@@ -623,10 +781,9 @@ class RequestSession(object):
         if not isinstance(error, requests.exceptions.HTTPError):
             return True
 
-        if http_code is not None and (400 <= http_code < 500):
-            return False
-
-        return True
+        return (
+            http_code is None or http_code >= 600 or bool(_IS_SERVER_ERROR[http_code])
+        )
 
     def retry_on_client_errors(self, http_code):
         # type: (Optional[int]) -> bool
@@ -640,6 +797,26 @@ class RequestSession(object):
 
         return False
 
+    def _response_snippet(self, response):
+        # type: (Union[requests.Response, Any]) -> str
+        """Return a capped snippet of the response body for logging.
+
+        Decodes at most ``max_response_log_bytes`` of the body using the
+        declared charset, so logging never triggers the whole-body charset
+        detection that ``response.text`` may run on large payloads.
+
+        :param request.Response response: HTTP Response Object
+        :return str: response text snippet
+        """
+        try:
+            content = response.content[: self.max_response_log_bytes]
+        except (AttributeError, TypeError):
+            return ""
+        try:
+            return content.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:  # server declared an unknown charset
+            return content.decode("utf-8", errors="replace")
+
     @staticmethod
     def get_response_text(response):
         # type: (Union[requests.Response, Any]) -> str
@@ -2,7 +2,7 @@
 
 import sys
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from .protocols import Ddtrace
 
@@ -10,6 +10,15 @@ from .protocols import Ddtrace
 class UserAgentComponents(object):
     """Helper class to wrap user-agent items into one object."""
 
+    __slots__ = (
+        "service_name",
+        "version",
+        "organization",
+        "environment",
+        "sys_info",
+        "user_agent",
+    )
+
     def __init__(self, service_name, version, organization, environment, sys_info=None):
         # type: (str, str, str, str, Optional[str]) -> None
         self.service_name = service_name
@@ -17,28 +26,56 @@ class UserAgentComponents(object):
         self.organization = organization
         self.environment = environment
         self.sys_info = sys_info
+        # components are immutable in practice, assemble the UA string once
+        self.user_agent = (
+            f"{service_name}/{version} ({organization} {environment})"
+            f" {sys_info if sys_info else ''}"
+        ).strip()
 
 
 def reraise_as_third_party():
     # type: () -> None
     """Add tags to raised exception for Sentry."""
-    setattr(sys.exc_info()[1], "__sentry_source", "third_party")
-    setattr(sys.exc_info()[1], "__sentry_pd_alert", "disabled")
+    exc = sys.exc_info()[1]
+    exc.__sentry_source = "third_party"  # type: ignore
+    exc.__sentry_pd_alert = "disabled"  # type: ignore
 
 
 def split_tags_and_update(dictionary, tags):
-    # type: (Dict[str, str], List[str]) -> None
+    # type: (Dict[str, str], Sequence[str]) -> None
     """Update dict with tags from string.
 
     Individual tags must be in format of <key>:<value>.
     """
-    dictionary.update(dict(tag.split(":", 1) for tag in tags))  # type: ignore
+    for tag in tags:
+        key, _, value = tag.partition(":")
+        dictionary[key] = value
+
+
+# bounded FIFO cache for dict_to_string - tag dicts rarely change between
+# requests, so repeat conversions short-circuit to the cached string
+_DICT_TO_STRING_CACHE = {}  # type: Dict[tuple, str]
+_DICT_TO_STRING_CACHE_SIZE = 128
 
 
 def dict_to_string(dictionary):
     # type: (Dict[str, Any]) -> str
-    """Convert dictionary to key=value pairs separated by a space."""
-    return " ".join([f"{key}={value}" for key, value in sorted(dictionary.items())])
+    """Convert dictionary to key=value pairs separated by a space.
+
+    Pairs follow the dictionary's insertion order. Results are memoized per
+    distinct set of items, as the same tag dicts tend to repeat per client.
+    """
+    cache_key = tuple(dictionary.items())
+    try:
+        cached = _DICT_TO_STRING_CACHE.get(cache_key)
+    except TypeError:  # unhashable values cannot be cached
+        return " ".join(f"{key}={value}" for key, value in dictionary.items())
+    if cached is None:
+        cached = " ".join(f"{key}={value}" for key, value in dictionary.items())
+        if len(_DICT_TO_STRING_CACHE) >= _DICT_TO_STRING_CACHE_SIZE:
+            del _DICT_TO_STRING_CACHE[next(iter(_DICT_TO_STRING_CACHE))]
+        _DICT_TO_STRING_CACHE[cache_key] = cached
+    return cached
 
 
 def traced_sleep(trace_name, seconds, ddtrace, tags=None):
@@ -51,6 +88,8 @@ def traced_sleep(trace_name, seconds, ddtrace, tags=None):
 
     :return: None
     """
+    if seconds <= 0:
+        return
     with ddtrace.tracer.trace(trace_name, service="sleep") as span:
         if tags:
             span.set_tags(tags)
@@ -1,15 +1,34 @@
-from io import open
+import os
+from pathlib import Path
 
 from setuptools import find_packages, setup
 
-with open("README.md", encoding="utf-8") as f:
-    readme = f.read()
+_skip = {"#", "-"}
 
-with open("requirements.in", encoding="utf-8") as f:
-    install_requires = [line for line in f if line and line[0] not in "#-"]
+# Opt-in ahead-of-time compilation of the request hot path. The default
+# remains a pure-Python wheel; set REQUEST_SESSION_COMPILE=1 with mypy
+# installed to build compiled extensions instead.
+ext_modules = []
+if os.environ.get("REQUEST_SESSION_COMPILE"):
+    from mypyc.build import mypycify
 
-with open("test-requirements.in", encoding="utf-8") as f:
-    tests_require = [line for line in f if line and line[0] not in "#-"]
+    ext_modules = mypycify(
+        ["request_session/request_session.py", "request_session/utils.py"]
+    )
+
+readme = Path("README.md").read_text(encoding="utf-8")
+
+install_requires = [
+    line
+    for line in Path("requirements.in").read_text(encoding="utf-8").splitlines()
+    if line and line[0] not in _skip
+]
+
+tests_require = [
+    line
+    for line in Path("test-requirements.in").read_text(encoding="utf-8").splitlines()
+    if line and line[0] not in _skip
+]
 
 setup(
     name="request_session",
@@ -21,6 +40,7 @@ setup(
     author="Kiwi.com platform team",
     author_email="platform@kiwi.com",
     packages=find_packages(exclude=["test*"]),
+    ext_modules=ext_modules,
     install_requires=install_requires,
     tests_require=tests_require,
     include_package_data=True,
@@ -1,14 +1,138 @@
 """Just a conftest."""
 
-from typing import Any, Callable
+import http.client
+from typing import Any, Callable, Iterator, Optional
+from unittest.mock import MagicMock
 
 import httpbin as Httpbin
 import pytest
+import requests
 
 from request_session import RequestSession
+from request_session.protocols import Ddtrace, Statsd
 
 
-@pytest.fixture(scope="function")
+def make_response(status, url=""):
+    # type: (int, str) -> requests.Response
+    """Build a real requests.Response with the given status code."""
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.reason = http.client.responses.get(status, "").upper()
+    return response
+
+
+def pytest_configure(config):
+    # type: (Any) -> None
+    config.addinivalue_line(
+        "markers",
+        "real_session: construct a real requests.Session per RequestSession "
+        "instead of reusing the shared one",
+    )
+    config.addinivalue_line(
+        "markers",
+        "serial: touches the class-level session registry; run in the "
+        "single-worker pass when the suite is parallelized",
+    )
+
+
+@pytest.fixture(scope="session")
+def _shared_session():
+    # type: () -> Iterator[requests.Session]
+    """One underlying requests.Session reused across tests."""
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(autouse=True)
+def shared_session(request, monkeypatch, _shared_session):
+    # type: (Any, Any, requests.Session) -> Iterator[Optional[requests.Session]]
+    """Reuse a single underlying session so tests skip per-instance TCP setup.
+
+    Tests exercising the session lifecycle itself opt out with the
+    ``real_session`` marker.
+    """
+    if request.node.get_closest_marker("real_session"):
+        yield None
+        return
+
+    _shared_session.headers = requests.utils.default_headers()
+    _shared_session.auth = None
+    monkeypatch.setattr(
+        "request_session.request_session.requests.Session", lambda: _shared_session
+    )
+    yield _shared_session
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(mocker):
+    # type: (Any) -> None
+    """Neutralize sleeps so retry loops run at CPU speed.
+
+    Tests asserting sleep arguments patch the relevant callable themselves,
+    which takes precedence over these stubs.
+    """
+    mocker.patch("request_session.request_session.traced_sleep")
+    mocker.patch("time.sleep")
+
+
+@pytest.fixture
+def stub_request(mocker, _shared_session):
+    # type: (Any, requests.Session) -> Any
+    """Short-circuit ``Session.request`` with a canned response.
+
+    The status code is parsed from ``/status/<code>`` paths, so the
+    parametrized status-code tests run without touching the network.
+    """
+
+    def _request(method=None, url="", **kwargs):
+        # type: (Optional[str], str, **Any) -> requests.Response
+        status = int(url.rsplit("/", 1)[1]) if "/status/" in url else 200
+        return make_response(status, url=url)
+
+    return mocker.patch.object(_shared_session, "request", side_effect=_request)
+
+
+@pytest.fixture(scope="session")
+def _statsd_template():
+    # type: () -> MagicMock
+    """Build the spec-walked Statsd mock once per session."""
+    return MagicMock(spec_set=Statsd)
+
+
+@pytest.fixture
+def mock_statsd(_statsd_template):
+    # type: (MagicMock) -> MagicMock
+    """A reset Statsd mock, reusing the session-wide template.
+
+    spec_set introspection is the dominant cost of MagicMock construction;
+    resetting one pre-built instance avoids repeating it per parametrize case.
+    """
+    _statsd_template.reset_mock()
+    return _statsd_template
+
+
+@pytest.fixture(scope="session")
+def _ddtrace_template():
+    # type: () -> MagicMock
+    """Build the spec-walked Ddtrace mock once per session."""
+    return MagicMock(spec_set=Ddtrace)
+
+
+@pytest.fixture
+def mock_ddtrace(_ddtrace_template):
+    # type: (MagicMock) -> MagicMock
+    """A fully reset Ddtrace mock, reusing the session-wide template.
+
+    Configured return values are cleared as well, so tests may set them
+    freely.
+    """
+    _ddtrace_template.reset_mock(return_value=True, side_effect=True)
+    return _ddtrace_template
+
+
+@pytest.fixture(scope="session")
 def request_session(httpbin):
     # type: (Httpbin) -> Callable
     def inner(*args, **kwargs):
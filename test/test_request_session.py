@@ -2,6 +2,7 @@
 
 import itertools
 import sys
+import weakref
 from typing import Any, Callable, Dict, Iterator, List, Union
 
 import httpbin as Httpbin
@@ -15,7 +16,7 @@ from request_session.exceptions import (
     RequestException,
     RequestSessionException,
 )
-from request_session.protocols import Ddtrace, SentryClient, Statsd
+from request_session.protocols import SentryClient, Statsd
 
 from ._compat import Mock
 
@@ -25,11 +26,48 @@ TIMEOUT_ERROR_MSG = "408 Client Error: REQUEST TIMEOUT for url:"
 DDTRACE_ERROR_MSG = "Ddtrace must be provided in order to report to datadog service."
 USER_AGENT_ERROR_MSG = "Provided User-Agent string is not valid."
 
+VALID_USER_AGENT_COMPONENTS = UserAgentComponents(
+    service_name="service_name",
+    version="1.1",
+    organization="Kiwi.com",
+    environment="testing",
+    sys_info="python 3.7",
+)
+# each entry blanks out one required component
+INVALID_USER_AGENT_COMPONENTS = [
+    UserAgentComponents("", "1.1", "Kiwi.com", "testing", "python 3.7"),
+    UserAgentComponents("service_name", "", "Kiwi.com", "testing", "python 3.7"),
+    UserAgentComponents("service_name", "1.1", "", "testing", "python 3.7"),
+    UserAgentComponents("service_name", "1.1", "Kiwi.com", "", "python 3.7"),
+]
+
+
+class ExceptionMatching(object):
+    """Equality helper for comparing exceptions inside ``mock.call`` objects.
+
+    Exceptions do not compare equal by value, so expected calls wrap them in
+    this matcher, which accepts any exception of the same type whose message
+    starts with the expected one.
+    """
+
+    def __init__(self, exception):
+        # type: (Exception) -> None
+        self.exception = exception
+
+    def __eq__(self, other):
+        # type: (Any) -> bool
+        return type(other) is type(self.exception) and str(other).startswith(
+            self.exception.args[0]
+        )
+
+    def __repr__(self):
+        # type: () -> str
+        return f"ExceptionMatching({self.exception!r})"
+
 
-def test_init(mocker, httpbin):
-    # type: (Mock, Httpbin) -> None
+def test_init(mocker, httpbin, mock_ddtrace):
+    # type: (Mock, Httpbin, Mock) -> None
     """Test initialization of RequestSession."""
-    mock_ddtrace = mocker.Mock(spec_set=Ddtrace)
     mock_tracing_config: dict = {}
     mock_ddtrace.config.get_from.return_value = mock_tracing_config
 
@@ -52,15 +90,7 @@ def test_init(mocker, httpbin):
 
 def test_correct_user_agent(request_session):
     # type: (Callable) -> None
-    client = request_session(
-        user_agent_components=UserAgentComponents(
-            service_name="service_name",
-            version="1.1",
-            organization="Kiwi.com",
-            environment="testing",
-            sys_info="python 3.7",
-        )
-    )
+    client = request_session(user_agent_components=VALID_USER_AGENT_COMPONENTS)
     assert client.user_agent == "service_name/1.1 (Kiwi.com testing) python 3.7"
 
 
@@ -68,82 +98,63 @@ def test_user_agent_precedence(request_session):
     # type: (Callable) -> None
     client = request_session(
         user_agent="hardcoded_user_agent",
-        user_agent_components=UserAgentComponents(
-            service_name="service_name",
-            version="1.1",
-            organization="Kiwi.com",
-            environment="testing",
-            sys_info="python 3.7",
-        ),
+        user_agent_components=VALID_USER_AGENT_COMPONENTS,
     )
 
     assert client.user_agent == "hardcoded_user_agent"
 
 
-@pytest.mark.parametrize(
-    "user_agent_components",
-    [
-        {
-            "service_name": "",
-            "version": "1.1",
-            "org": "Kiwi.com",
-            "env": "testing",
-            "sys_info": "python 3.7",
-        },
-        {
-            "service_name": "service_name",
-            "version": "",
-            "org": "Kiwi.com",
-            "env": "testing",
-            "sys_info": "python 3.7",
-        },
-        {
-            "service_name": "service_name",
-            "version": "1.1",
-            "org": "",
-            "env": "testing",
-            "sys_info": "python 3.7",
-        },
-        {
-            "service_name": "service_name",
-            "version": "1.1",
-            "org": "Kiwi.com",
-            "env": "",
-            "sys_info": "python 3.7",
-        },
-    ],
-)
+@pytest.mark.parametrize("user_agent_components", INVALID_USER_AGENT_COMPONENTS)
 def test_incorrect_user_agent_components(request_session, user_agent_components):
-    # type: (Callable, Dict) -> None
+    # type: (Callable, UserAgentComponents) -> None
     with pytest.raises(InvalidUserAgentString, match=USER_AGENT_ERROR_MSG):
-        request_session(
-            user_agent_components=UserAgentComponents(
-                service_name=user_agent_components["service_name"],
-                version=user_agent_components["version"],
-                organization=user_agent_components["org"],
-                environment=user_agent_components["env"],
-                sys_info=user_agent_components["sys_info"],
-            )
-        )
+        request_session(user_agent_components=user_agent_components)
 
 
-def test_remove_session(request_session):
-    # type: (Callable) -> None
+@pytest.mark.real_session
+@pytest.mark.serial
+def test_remove_session(request_session, monkeypatch):
+    # type: (Callable, Any) -> None
+    monkeypatch.setattr(RequestSession, "session_instances", weakref.WeakSet())
     session = RequestSession(host="https://kiwi.com")
-    before = len(session.session_instances)
+    assert len(session.session_instances) == 1
     session.remove_session()
-    assert len(session.session_instances) == before - 1
+    assert not session.session_instances
 
 
-def test_close_all_sessions():
-    # type: () -> None
+@pytest.mark.real_session
+@pytest.mark.serial
+def test_close_all_sessions(monkeypatch):
+    # type: (Any) -> None
+    # start from an empty registry so counts are exact and unaffected by
+    # sessions other tests may have left behind
+    monkeypatch.setattr(RequestSession, "session_instances", weakref.WeakSet())
     session = RequestSession(host="https://kiwi.com")
+    first_session = session.session  # keep a reference so it is not collected
     session.prepare_new_session()
-    assert len(RequestSession.session_instances) >= 2
+    assert set(RequestSession.session_instances) == {first_session, session.session}
     RequestSession.close_all_sessions()
     assert not RequestSession.session_instances
 
 
+@pytest.mark.real_session
+def test_session_ttl(request_session, mocker):
+    # type: (Callable, Mock) -> None
+    """Test lazy session replacement once the configured TTL is exceeded."""
+    client = request_session(session_ttl=100)  # type: RequestSession
+    original_session = client.session
+
+    client.get(path="/status/200")
+    assert client.session is original_session
+
+    mocker.patch(
+        "request_session.request_session.time.monotonic",
+        return_value=client._session_created + 101,
+    )
+    client.get(path="/status/200")
+    assert client.session is not original_session
+
+
 @pytest.mark.parametrize(
     "method, path, expected_status",
     [
@@ -172,8 +183,8 @@ def test_method(request_session, method, path, expected_status):
         (505, HTTPError),
     ],
 )
-def test_raise_for_status(mocker, httpbin, status_code, raises):
-    # type: (Mock, Httpbin, int, Exception) -> None
+def test_raise_for_status(mocker, httpbin, stub_request, status_code, raises):
+    # type: (Mock, Httpbin, Mock, int, Exception) -> None
     """Test raising of an exception when rejected with 4xx."""
     session = RequestSession(host=httpbin.url, request_category=REQUEST_CATEGORY)
     mock_sys = mocker.patch("request_session.utils.sys", spec_set=sys)
@@ -207,6 +218,7 @@ def test_raise_for_status(mocker, httpbin, status_code, raises):
         ),
     ],
 )
+@pytest.mark.real_session
 def test_econnreset_error(
     httpbin, mocker, exceptions, max_retries, expected_call_count
 ):
@@ -214,8 +226,11 @@ def test_econnreset_error(
     used_sessions = []
 
     def _prepare_new_session(self):  # type: ignore
-        self.session = mocker.Mock(spec=requests.Session)
-        self.session_instances.append(self.session)
+        # a bare Mock suffices here: only .request and .close are touched,
+        # and speccing against requests.Session walks the whole class per
+        # replaced session
+        self.session = mocker.Mock()
+        self.session_instances.add(self.session)
         self.session.request.side_effect = next(exceptions)
 
         used_sessions.append(self.session)
@@ -223,12 +238,12 @@ def test_econnreset_error(
     client = RequestSession(
         host=httpbin.url, max_retries=max_retries, request_category=REQUEST_CATEGORY
     )
-    mock_log = mocker.Mock(autospec=True)
-    mock_exception_log_and_metrics = mocker.Mock(
-        spec=RequestSession._exception_log_and_metrics
+    mock_log = mocker.patch.object(RequestSession, "log", mocker.Mock(autospec=True))
+    mock_exception_log_and_metrics = mocker.patch.object(
+        RequestSession,
+        "_exception_log_and_metrics",
+        mocker.Mock(spec=RequestSession._exception_log_and_metrics),
     )
-    client.log = mock_log  # type: ignore
-    client._exception_log_and_metrics = mock_exception_log_and_metrics  # type: ignore
 
     mocker.patch.object(
         RequestSession, "prepare_new_session", new=_prepare_new_session, spec_set=True
@@ -297,27 +312,31 @@ def test_econnreset_error(
         ),
     ],
 )
-def test_logging(mocker, request_session, inputs, expected):
-    # type: (Mock, Callable, Dict[str, Any], Dict[str, Any]) -> None
-    mock_exception_log_and_metrics = mocker.Mock(
-        spec_set=RequestSession._exception_log_and_metrics
+def test_logging(mocker, request_session, stub_request, inputs, expected):
+    # type: (Mock, Callable, Mock, Dict[str, Any], Dict[str, Any]) -> None
+    mock_exception_log_and_metrics = mocker.patch.object(
+        RequestSession,
+        "_exception_log_and_metrics",
+        mocker.Mock(spec_set=RequestSession._exception_log_and_metrics),
     )
     client = request_session(max_retries=inputs["max_retries"])
-    client._exception_log_and_metrics = mock_exception_log_and_metrics
     expected["request_params"]["url"] = f"{client.host}{inputs['path']}"
 
-    calls = []
-    for attempt in range(1, expected["call_count"] + 1):
-        calls.append(
-            mocker.call(
-                error=expected["exception"](expected["description"]),
-                request_category=client._get_request_category(),
-                request_params=expected["request_params"],
-                dd_tags=expected["error_tags"],
-                status_code=expected["status_code"],
-                attempt=attempt,
-            )
+    request_category = client._get_request_category()
+    error_matching = expected["exception"] and ExceptionMatching(
+        expected["exception"](expected["description"])
+    )
+    calls = [
+        mocker.call(
+            error=error_matching,
+            request_category=request_category,
+            request_params=expected["request_params"],
+            dd_tags=expected["error_tags"],
+            status_code=expected["status_code"],
+            attempt=attempt,
         )
+        for attempt in range(1, expected["call_count"] + 1)
+    ]
 
     if expected["exception"]:
         with pytest.raises(expected["exception"]):
@@ -326,15 +345,7 @@ def test_logging(mocker, request_session, inputs, expected):
         client.get(path=inputs["path"], tags=inputs["tags"])
 
     assert mock_exception_log_and_metrics.call_count == expected["call_count"]
-    # compare everything manually because exceptions cannot be compared directly
-    # with mock.assert_has_calls
-    for mock, actual in zip(calls, mock_exception_log_and_metrics.mock_calls):
-        for key, value in actual[2].items():
-            if key == "error":
-                assert type(mock[2][key]) is type(value)
-                assert value.args[0].startswith(mock[2][key].args[0])
-            else:
-                assert mock[2][key] == value
+    assert mock_exception_log_and_metrics.call_args_list == calls
 
 
 @pytest.mark.parametrize(
@@ -347,28 +358,58 @@ def test_logging(mocker, request_session, inputs, expected):
     ],
 )
 def test_metric_increment(
-    mocker, request_session, path, max_retries, status, error, call_count
+    mocker,
+    request_session,
+    stub_request,
+    mock_statsd,
+    path,
+    max_retries,
+    status,
+    error,
+    call_count,
 ):
-    # type: (Mock, Callable, str, int, str, Union[str, None], int) -> None
+    # type: (Mock, Callable, Mock, Mock, str, int, str, Union[str, None], int) -> None
     """Test correct incrementing of metrics when call is performed."""
-    mock_statsd = mocker.MagicMock(spec_set=Statsd)
     client = request_session(
         max_retries=max_retries, statsd=mock_statsd
     )  # type: RequestSession
     client.get(path=path, raise_for_status=False)
 
-    calls = []
-    for attempt in range(1, call_count + 1):
-        metric = f"{client._get_request_category()}.request"
-        tags = [f"status:{status}"]
-        if error:
-            tags.append(f"error:{error}")
-        calls.append(mocker.call(metric, tags=tags + [f"attempt:{attempt}"]))
+    metric = f"{client._get_request_category()}.request"
+    base_tags = (f"status:{status}",)
+    if error:
+        base_tags += (f"error:{error}",)
+    calls = [
+        mocker.call(metric, tags=(*base_tags, f"attempt:{attempt}"))
+        for attempt in range(1, call_count + 1)
+    ]
 
     assert mock_statsd.increment.call_count == call_count
     mock_statsd.increment.assert_has_calls(calls)
 
 
+def test_metric_buffering(mocker, request_session, mock_statsd):
+    # type: (Mock, Callable, Mock) -> None
+    """Test aggregation of metric increments when buffering is enabled."""
+    client = request_session(
+        statsd=mock_statsd, metric_flush_every=3
+    )  # type: RequestSession
+
+    client.metric_increment("request", "test", ("status:success",))
+    client.metric_increment("request", "test", ("status:success",))
+    mock_statsd.increment.assert_not_called()
+
+    # the third buffered increment reaches the flush threshold
+    client.metric_increment("request", "test", ("status:error",))
+    mock_statsd.increment.assert_has_calls(
+        [
+            mocker.call("test.request", value=2, tags=("status:success",)),
+            mocker.call("test.request", value=1, tags=("status:error",)),
+        ]
+    )
+    assert not client._metric_buffer
+
+
 def test_get_request_category(httpbin):
     # type: (Httpbin) -> None
     client = RequestSession(host=httpbin.url)
@@ -401,11 +442,10 @@ def test_sleep_before_repeat(
 ):
     # type: (Mock, Callable, str, int, int, List[str], int) -> None
     mock_ddtrace = mocker.Mock(spec_set=Statsd)
-    mock_sleep = mocker.Mock()
+    mock_sleep = mocker.patch.object(RequestSession, "sleep", mocker.Mock())
     client = request_session(
         max_retries=max_retries, ddtrace=mock_ddtrace, raise_for_status=False
     )  # type: RequestSession
-    client.sleep = mock_sleep  # type: ignore
 
     client.get(path=path, sleep_before_repeat=seconds, tags=tags)
     assert mock_sleep.call_count == call_count
@@ -413,6 +453,20 @@ def test_sleep_before_repeat(
         mock_sleep.assert_called_with(seconds, client.request_category, tags)
 
 
+def test_exponential_backoff(mocker, request_session):
+    # type: (Mock, Callable) -> None
+    mock_sleep = mocker.patch("request_session.request_session.time.sleep")
+    mocker.patch("request_session.request_session.random.random", return_value=0.5)
+    client = request_session(
+        max_retries=2, backoff_base=2.0, max_backoff=3.0, raise_for_status=False
+    )  # type: RequestSession
+
+    client.get(path="/status/500")
+
+    # full jitter: random() * min(backoff_base * 2 ** (run - 1), max_backoff)
+    assert mock_sleep.call_args_list == [mocker.call(1.0), mocker.call(1.5)]
+
+
 @pytest.mark.parametrize(
     "inputs, expected",
     [
@@ -436,9 +490,8 @@ def test_sleep_before_repeat(
         ),
     ],
 )
-def test_send_request(request_session, mocker, inputs, expected):
-    # type: (Callable, Mock, Dict[str, Any], Dict[str, Any]) -> None
-    mock_statsd = mocker.MagicMock(spec_set=Statsd)
+def test_send_request(request_session, mocker, mock_statsd, inputs, expected):
+    # type: (Callable, Mock, Mock, Dict[str, Any], Dict[str, Any]) -> None
     client = request_session(statsd=mock_statsd)  # type: RequestSession
     request_params = {
         "url": client.host + inputs["path"],
@@ -463,15 +516,12 @@ def test_send_request(request_session, mocker, inputs, expected):
     )
 
 
-def test_sleep(httpbin, mocker):
-    # type: (Httpbin, Mock) -> None
+def test_sleep(httpbin, mocker, mock_ddtrace):
+    # type: (Httpbin, Mock, Mock) -> None
     seconds = 1
     tags = ["testing:sleep"]
     meta = {"request_category": REQUEST_CATEGORY, "testing": "sleep"}
-    mock_ddtrace = mocker.MagicMock(spec_set=Ddtrace)
-    mock_traced_sleep = mocker.patch(
-        "request_session.request_session.traced_sleep", autospec=True
-    )
+    mock_traced_sleep = mocker.patch("request_session.request_session.traced_sleep")
     client = RequestSession(host=httpbin.url, ddtrace=mock_ddtrace)
     client.sleep(seconds, REQUEST_CATEGORY, tags)
 
@@ -480,144 +530,147 @@ def test_sleep(httpbin, mocker):
     )
 
 
-@pytest.mark.parametrize(
-    "inputs, expected",
-    [
-        (
-            {
-                "error": requests.exceptions.Timeout("Timeout"),
+EXCEPTION_LOG_AND_METRICS_CASES = [
+    (
+        {
+            "error": lambda: requests.exceptions.Timeout("Timeout"),
+            "attempt": 1,
+            "tags": [],
+            "request_params": {},
+            "status_code": 408,
+        },
+        {
+            "tags": ("status:error", "error:timeout", "attempt:1"),
+            "extra_params": {
+                "description": "Timeout",
+                "response_text": "",
+                "status": "error",
                 "attempt": 1,
-                "tags": [],
-                "request_params": {},
-                "verbose_logging": False,
-                "status_code": 408,
             },
-            {
-                "tags": ["status:error", "error:timeout", "attempt:1"],
-                "extra_params": {
-                    "description": "Timeout",
-                    "response_text": "",
-                    "status": "error",
-                    "attempt": 1,
-                },
-                "error_type": "read_timeout",
-            },
-        ),
-        (
-            {
-                "error": requests.exceptions.HTTPError("HTTPError"),
+            "error_type": "read_timeout",
+        },
+    ),
+    (
+        {
+            "error": lambda: requests.exceptions.HTTPError("HTTPError"),
+            "attempt": 1,
+            "tags": [],
+            "request_params": {},
+            "status_code": 400,
+        },
+        {
+            "tags": ("status:error", "error:http_error", "attempt:1"),
+            "extra_params": {
+                "description": "HTTPError",
+                "response_text": "",
+                "status": "error",
                 "attempt": 1,
-                "tags": [],
-                "request_params": {},
-                "verbose_logging": False,
-                "status_code": 400,
-            },
-            {
-                "tags": ["status:error", "error:http_error", "attempt:1"],
-                "extra_params": {
-                    "description": "HTTPError",
-                    "response_text": "",
-                    "status": "error",
-                    "attempt": 1,
-                },
-                "error_type": "http_error",
             },
-        ),
-        (
-            {
-                "error": requests.exceptions.ConnectionError("ConnectionError"),
+            "error_type": "http_error",
+        },
+    ),
+    (
+        {
+            "error": lambda: requests.exceptions.ConnectionError("ConnectionError"),
+            "attempt": 1,
+            "tags": [],
+            "request_params": {},
+            "status_code": 444,
+        },
+        {
+            "tags": ("status:error", "error:connection_error", "attempt:1"),
+            "extra_params": {
+                "description": "ConnectionError",
+                "response_text": "",
+                "status": "error",
                 "attempt": 1,
-                "tags": [],
-                "request_params": {},
-                "verbose_logging": False,
-                "status_code": 444,
-            },
-            {
-                "tags": ["status:error", "error:connection_error", "attempt:1"],
-                "extra_params": {
-                    "description": "ConnectionError",
-                    "response_text": "",
-                    "status": "error",
-                    "attempt": 1,
-                },
-                "error_type": "connection_error",
             },
-        ),
-        (
-            {
-                "error": requests.exceptions.URLRequired("URLRequired"),
+            "error_type": "connection_error",
+        },
+    ),
+    (
+        {
+            "error": lambda: requests.exceptions.URLRequired("URLRequired"),
+            "attempt": 1,
+            "tags": [],
+            "request_params": {},
+            "status_code": None,
+        },
+        {
+            "tags": ("status:error", "error:request_exception", "attempt:1"),
+            "extra_params": {
+                "description": "URLRequired",
+                "response_text": "",
+                "status": "error",
                 "attempt": 1,
-                "tags": [],
-                "request_params": {},
-                "verbose_logging": False,
-                "status_code": None,
-            },
-            {
-                "tags": ["status:error", "error:request_exception", "attempt:1"],
-                "extra_params": {
-                    "description": "URLRequired",
-                    "response_text": "",
-                    "status": "error",
-                    "attempt": 1,
-                },
-                "error_type": "request_exception",
             },
-        ),
-        (
-            {  # custom tags passed to the _exception_log_and_metrics
-                "error": requests.exceptions.Timeout("Timeout"),
+            "error_type": "request_exception",
+        },
+    ),
+    (
+        {  # custom tags passed to the _exception_log_and_metrics
+            "error": lambda: requests.exceptions.Timeout("Timeout"),
+            "attempt": 1,
+            "tags": ["custom:tags"],
+            "request_params": {},
+            "status_code": 408,
+        },
+        {
+            "tags": ("status:error", "custom:tags", "error:timeout", "attempt:1"),
+            "extra_params": {
+                "description": "Timeout",
+                "response_text": "",
+                "status": "error",
                 "attempt": 1,
-                "tags": ["custom:tags"],
-                "request_params": {},
-                "verbose_logging": False,
-                "status_code": 408,
-            },
-            {
-                "tags": ["status:error", "custom:tags", "error:timeout", "attempt:1"],
-                "extra_params": {
-                    "description": "Timeout",
-                    "response_text": "",
-                    "status": "error",
-                    "attempt": 1,
-                    "custom": "tags",
-                },
-                "error_type": "read_timeout",
+                "custom": "tags",
             },
-        ),
-    ],
-)
-def test_exception_and_log_metrics(request_session, mocker, inputs, expected):
-    # type: (Callable, Mock, Dict[str, Any], Dict[str, Any]) -> None
-    mock_log = mocker.Mock()
-    mock_metric_increment = mocker.Mock()
+            "error_type": "read_timeout",
+        },
+    ),
+]
+
+
+def test_exception_and_log_metrics(request_session, mocker, mock_statsd):
+    # type: (Callable, Mock, Mock) -> None
+    """Run the error-classification table against one client.
+
+    A plain in-test loop instead of parametrize keeps collection to a single
+    node; mocks are reset between cases.
+    """
+    mock_log = mocker.patch.object(RequestSession, "log", mocker.Mock())
+    mock_metric_increment = mocker.patch.object(
+        RequestSession, "metric_increment", mocker.Mock()
+    )
     client = request_session(
-        verbose_logging=inputs["verbose_logging"]
+        verbose_logging=False, statsd=mock_statsd
     )  # type: RequestSession
-    client.log = mock_log  # type: ignore
-    client.metric_increment = mock_metric_increment  # type: ignore
-
-    client._exception_log_and_metrics(  # type: ignore
-        error=inputs["error"],
-        request_category=client.request_category,
-        request_params=inputs["request_params"],
-        dd_tags=inputs["tags"],
-        status_code=inputs["status_code"],
-        attempt=inputs["attempt"],
-    )
 
-    mock_log.assert_called_once_with(
-        "exception",
-        f"{client.request_category}.failed",
-        error_type=expected["error_type"],
-        status_code=inputs["status_code"],
-        **expected["extra_params"],
-    )
+    for inputs, expected in EXCEPTION_LOG_AND_METRICS_CASES:
+        client._exception_log_and_metrics(  # type: ignore
+            error=inputs["error"](),
+            request_category=client.request_category,
+            request_params=inputs["request_params"],
+            dd_tags=inputs["tags"],
+            status_code=inputs["status_code"],
+            attempt=inputs["attempt"],
+        )
 
-    mock_metric_increment.assert_called_once_with(
-        metric="request",
-        request_category=client.request_category,
-        tags=expected["tags"],
-    )
+        mock_log.assert_called_once_with(
+            "exception",
+            f"{client.request_category}.failed",
+            error_type=expected["error_type"],
+            status_code=inputs["status_code"],
+            **expected["extra_params"],
+        )
+
+        mock_metric_increment.assert_called_once_with(
+            metric="request",
+            request_category=client.request_category,
+            tags=expected["tags"],
+        )
+
+        mock_log.reset_mock()
+        mock_metric_increment.reset_mock()
 
 
 def test_get_response_text(mocker):
@@ -628,8 +681,8 @@ def test_get_response_text(mocker):
     assert RequestSession.get_response_text("not_a_response_obj") == ""
 
 
-def test_reporting(request_session, mocker):
-    # type: (Callable, Mock) -> None
+def test_reporting(request_session, mocker, stub_request):
+    # type: (Callable, Mock, Mock) -> None
     """Test reporting of failure when rejected with 4xx."""
     mock_sentry_client = mocker.Mock(spec_set=SentryClient)
     session = request_session(raise_for_status=False, sentry_client=mock_sentry_client)
@@ -638,22 +691,24 @@ def test_reporting(request_session, mocker):
 
 
 @pytest.mark.parametrize(
-    ("exception, status_code, expected"),
+    ("exception_factory, status_code, expected"),
     [
-        (requests.exceptions.RequestException(), None, True),
-        (requests.exceptions.ConnectionError(), None, True),
-        (requests.exceptions.Timeout(), None, True),
-        (requests.exceptions.HTTPError(), 400, False),
-        (requests.exceptions.HTTPError(), 399, True),
-        (requests.exceptions.HTTPError(), 408, False),
-        (requests.exceptions.HTTPError(), 499, False),
-        (requests.exceptions.HTTPError(), 500, True),
-        (requests.exceptions.HTTPError(), None, True),
+        # exception classes double as factories so instances are only
+        # allocated when the test runs, not at collection time
+        (requests.exceptions.RequestException, None, True),
+        (requests.exceptions.ConnectionError, None, True),
+        (requests.exceptions.Timeout, None, True),
+        (requests.exceptions.HTTPError, 400, False),
+        (requests.exceptions.HTTPError, 399, True),
+        (requests.exceptions.HTTPError, 408, False),
+        (requests.exceptions.HTTPError, 499, False),
+        (requests.exceptions.HTTPError, 500, True),
+        (requests.exceptions.HTTPError, None, True),
     ],
 )
-def test_is_server_error(exception, status_code, expected):
-    # type: (RequestException, Union[int, None], bool) -> None
-    assert RequestSession.is_server_error(exception, status_code) == expected
+def test_is_server_error(exception_factory, status_code, expected):
+    # type: (Callable, Union[int, None], bool) -> None
+    assert RequestSession.is_server_error(exception_factory(), status_code) == expected
 
 
 @pytest.mark.parametrize(
@@ -5,7 +5,6 @@ from typing import Dict, List
 
 import pytest
 
-from request_session.protocols import Ddtrace
 from request_session.utils import (
     dict_to_string,
     reraise_as_third_party,
@@ -51,19 +50,18 @@ def test_dict_to_string(dictionary, expected):
     assert dict_to_string(dictionary) == expected
 
 
-def test_traced_sleep(mocker):
-    # type: (Mock) -> None
+def test_traced_sleep(mocker, mock_ddtrace):
+    # type: (Mock, Mock) -> None
     seconds = 1
     request_category = "request_category"
     tags = {"request_category": request_category, "testing": "sleep"}
-    mock_ddtrace = mocker.MagicMock(spec_set=Ddtrace)
     mock_span = mocker.Mock()
     mock_ddtrace.tracer.trace.return_value.__enter__.return_value = mock_span
-    mock_time = mocker.patch("request_session.utils.time", autospec=True)
+    mock_sleep = mocker.patch("request_session.utils.time.sleep")
 
     traced_sleep(request_category, seconds, mock_ddtrace, tags)
 
     mock_ddtrace.tracer.trace.assert_called_once_with(request_category, service="sleep")
 
     mock_span.set_tags.assert_called_once_with(tags)
-    mock_time.sleep.assert_called_once_with(seconds)
+    mock_sleep.assert_called_once_with(seconds)